@@ -5,6 +5,7 @@ from sklearn.preprocessing import MinMaxScaler
 from sklearn.cluster import KMeans
 from scripts.DB_connection import PostgresConnection
 from src.Eda import missing_values_table, convert_bytes_to_megabytes, convert_ms_to_seconds
+from src.GroupIndex import GroupIndex
 
 def load_data():
     # Establishing the database connection
@@ -91,8 +92,17 @@ def preprocess_engagement_data(df):
     
     return df_user_engagement
 
-def report_top_customers(df_user_engagement):
-    grouped_df = group_data(df_user_engagement)
+def report_top_customers(df_user_engagement, customer_index=None):
+    if customer_index is None:
+        customer_index = GroupIndex(df_user_engagement['MSISDN/Number'])
+    # One pass per column over the factorized MSISDNs instead of a groupby per metric
+    grouped_df = customer_index.agg(df_user_engagement, {
+        'Dur. (s)': 'sum',
+        'Total DL (Megabytes)': 'sum',
+        'Total UL (Megabytes)': 'sum'
+    })
+    grouped_df['Session Frequency'] = customer_index.size()
+    grouped_df = grouped_df.reset_index()
 
     top_10_duration = grouped_df.sort_values(by='Dur. (s)', ascending=False).head(10)
     top_10_download = grouped_df.sort_values(by='Total DL (Megabytes)', ascending=False).head(10)
@@ -107,8 +117,6 @@ def report_top_customers(df_user_engagement):
     st.write("### Top 10 customers by total upload traffic")
     st.write(top_10_upload)
     
-    session_frequency = df_user_engagement.groupby('MSISDN/Number').size().reset_index(name='Session Frequency')
-    grouped_df = grouped_df.merge(session_frequency, on='MSISDN/Number')
     top_10_session_frequency = grouped_df.sort_values(by='Session Frequency', ascending=False).head(10)
     
     st.write("### Top 10 customers by session frequency")
@@ -165,6 +173,7 @@ def app():
     df = load_data()
     if not df.empty:
         df_user_engagement = preprocess_engagement_data(df)
-        grouped_df = report_top_customers(df_user_engagement)
+        customer_index = GroupIndex(df_user_engagement['MSISDN/Number'])
+        grouped_df = report_top_customers(df_user_engagement, customer_index)
         cluster_stats = normalize_and_cluster(grouped_df)
         visualize_clusters(cluster_stats)
@@ -5,6 +5,7 @@ import seaborn as sns
 from sklearn.cluster import KMeans
 from sklearn.preprocessing import StandardScaler
 from scripts.DB_connection import PostgresConnection
+from src.GroupIndex import GroupIndex
 
 def load_data():
     # Establishing the database connection
@@ -56,7 +57,7 @@ def preprocess_data(df):
     
     return df_user_experience
 
-def analyze_experience(df_user_experience):
+def analyze_experience(df_user_experience, handset_index=None):
     df_user_experience['Total TCP Retransmission'] = df_user_experience['TCP DL Retrans. Vol (Megabytes)'] + df_user_experience['TCP UL Retrans. Vol (Megabytes)']
     df_user_experience['Total RTT'] = df_user_experience['Avg RTT DL (s)'] + df_user_experience['Avg RTT UL (s)']
     df_user_experience['Total Throughput'] = df_user_experience['Avg Bearer TP DL (kbps)'] + df_user_experience['Avg Bearer TP UL (kbps)']
@@ -93,7 +94,9 @@ def analyze_experience(df_user_experience):
     # Average throughput per handset type
     st.write("### Average Throughput per Handset Type")
     df_user_experience['Avg Throughput'] = (df_user_experience['Avg Bearer TP DL (kbps)'] + df_user_experience['Avg Bearer TP UL (kbps)']) / 2
-    throughput_per_handset = df_user_experience.groupby('Handset Type')['Avg Throughput'].mean().reset_index()
+    if handset_index is None:
+        handset_index = GroupIndex(df_user_experience['Handset Type'])
+    throughput_per_handset = handset_index.mean(df_user_experience['Avg Throughput']).rename('Avg Throughput').reset_index()
     st.write(throughput_per_handset)
 
 def cluster_experience(df_user_experience):
@@ -133,5 +136,6 @@ def app():
     df = load_data()
     if not df.empty:
         df_user_experience = preprocess_data(df)
-        analyze_experience(df_user_experience)
+        handset_index = GroupIndex(df_user_experience['Handset Type'])
+        analyze_experience(df_user_experience, handset_index)
         cluster_experience(df_user_experience)
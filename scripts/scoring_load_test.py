@@ -0,0 +1,91 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import HTTPError
+from urllib.parse import quote
+from urllib.request import urlopen
+
+import numpy as np
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Scoring import load_user_index
+from scripts.scoring_server import add_scorer_arguments, check_scorer_arguments, batcher_from_args
+
+
+def run_load_test(score_fn, keys, n_requests=10000, concurrency=32):
+    """
+    Fire `n_requests` single-key calls at `score_fn` from `concurrency` threads
+    and report throughput and latency percentiles in milliseconds.
+    """
+    request_keys = [keys[i % len(keys)] for i in range(n_requests)]
+
+    def timed_call(key):
+        start = time.perf_counter()
+        score_fn(key)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = np.fromiter(executor.map(timed_call, request_keys), dtype=float, count=n_requests)
+    elapsed = time.perf_counter() - start
+
+    latencies_ms = latencies * 1000
+    return {
+        'requests': n_requests,
+        'concurrency': concurrency,
+        'elapsed (s)': elapsed,
+        'throughput (req/s)': n_requests / elapsed,
+        'p50 (ms)': np.percentile(latencies_ms, 50),
+        'p95 (ms)': np.percentile(latencies_ms, 95),
+        'p99 (ms)': np.percentile(latencies_ms, 99),
+        'max (ms)': latencies_ms.max(),
+    }
+
+def http_score_fn(base_url):
+    """
+    Return a single-key scoring function that calls a running scoring server.
+    """
+    def score(key):
+        try:
+            with urlopen(f"{base_url}/score?key={quote(str(key))}") as response:
+                return response.read()
+        except HTTPError as e:
+            # 404 means the key is not in the index, which still counts as an answered request
+            if e.code != 404:
+                raise
+            return e.read()
+    return score
+
+def print_report(report):
+    print("### Scoring Load Test ###\n")
+    for name, value in report.items():
+        print(f"{name}: {value:.3f}" if isinstance(value, float) else f"{name}: {value}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the satisfaction scoring service.")
+    add_scorer_arguments(parser)
+    parser.add_argument('--url', help="Base URL of a running scoring server (scripts/scoring_server.py); scores in-process if omitted")
+    parser.add_argument('--requests', type=int, default=10000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    args = parser.parse_args()
+    if not args.url:
+        check_scorer_arguments(parser, args)
+
+    keys = load_user_index(args.index).index.tolist()
+
+    if args.url:
+        print_report(run_load_test(http_score_fn(args.url.rstrip('/')), keys, args.requests, args.concurrency))
+        return
+
+    batcher = batcher_from_args(args)
+    try:
+        print_report(run_load_test(batcher.score, keys, args.requests, args.concurrency))
+    finally:
+        batcher.stop()
+
+if __name__ == '__main__':
+    main()
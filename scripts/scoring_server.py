@@ -0,0 +1,77 @@
+import argparse
+import os
+import signal
+import sys
+import threading
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Scoring import SatisfactionScorer, MicroBatcher, make_scoring_server
+
+SCORER_ARGUMENTS = ['engagement_centroids', 'experience_centroids', 'model', 'engagement_columns', 'experience_columns']
+
+
+def add_scorer_arguments(parser):
+    """
+    Add the options needed to build a SatisfactionScorer and its MicroBatcher.
+    """
+    parser.add_argument('--index', required=True, help="Per-user aggregate index (pickle)")
+    parser.add_argument('--engagement-centroids', help="Engagement centroid CSV")
+    parser.add_argument('--experience-centroids', help="Experience centroid CSV")
+    parser.add_argument('--model', help="Satisfaction regression model (joblib)")
+    parser.add_argument('--engagement-columns', nargs='+')
+    parser.add_argument('--experience-columns', nargs='+')
+    parser.add_argument('--satisfaction-columns', nargs='+',
+                        default=['Engagement Score', 'Experience Score', 'Total Traffic (Bytes)'])
+    parser.add_argument('--engagement-scaler')
+    parser.add_argument('--experience-scaler')
+    parser.add_argument('--satisfaction-scaler')
+    parser.add_argument('--max-batch-size', type=int, default=256)
+    parser.add_argument('--max-wait-ms', type=float, default=2.0)
+
+def check_scorer_arguments(parser, args):
+    missing = ['--' + name.replace('_', '-') for name in SCORER_ARGUMENTS if not getattr(args, name)]
+    if missing:
+        parser.error(f"the following arguments are required to build the scorer: {', '.join(missing)}")
+
+def batcher_from_args(args):
+    """
+    Build the scorer from the parsed options and return a started MicroBatcher.
+    """
+    scorer = SatisfactionScorer.from_files(
+        args.index, args.engagement_centroids, args.experience_centroids, args.model,
+        args.engagement_columns, args.experience_columns, args.satisfaction_columns,
+        engagement_scaler_path=args.engagement_scaler,
+        experience_scaler_path=args.experience_scaler,
+        satisfaction_scaler_path=args.satisfaction_scaler,
+    )
+    return MicroBatcher(scorer, args.max_batch_size, args.max_wait_ms).start()
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve satisfaction scores over HTTP: GET /score?key=<MSISDN or IMSI>.")
+    add_scorer_arguments(parser)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--timeout', type=float, default=5.0, help="Seconds to wait for a score before answering 500")
+    args = parser.parse_args()
+    check_scorer_arguments(parser, args)
+
+    batcher = batcher_from_args(args)
+    server = make_scoring_server(batcher, args.host, args.port, args.timeout)
+
+    # serve_forever blocks this thread, so SIGTERM asks for shutdown from another one
+    signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=server.shutdown).start())
+
+    print(f"Serving satisfaction scores on http://{args.host}:{server.server_address[1]}/score?key=<MSISDN or IMSI>")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        batcher.stop()
+        print("Scoring server stopped.")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+
+class GroupIndex:
+    """
+    Factorizes a key column once into integer codes with sorted group offsets,
+    so repeated aggregations over the same key are one linear pass each instead of a re-hashing groupby.
+    Rows with a missing key are left out of every group, like `groupby(dropna=True)`.
+    Only observed keys become groups, so categorical keys behave like `groupby(observed=True)`.
+
+    Numeric and bool columns support every aggregation. Datetime, timedelta and other columns
+    (e.g. strings) support count, size, min and max only; naive datetimes and timedeltas keep
+    their dtype. Series passed in must carry the same index as the keys the GroupIndex was built
+    from, since values are matched to keys by position.
+    """
+
+    AGGREGATIONS = ('sum', 'mean', 'count', 'size', 'min', 'max')
+
+    def __init__(self, keys):
+        keys = pd.Series(keys)
+        self.name = keys.name
+        self.source_index = keys.index
+        self.fingerprint = self._fingerprint(keys)
+        codes, uniques = pd.factorize(keys, sort=True)
+        self.codes = codes
+        self.groups = pd.Index(uniques, name=keys.name)
+        self.n_rows = len(codes)
+
+        valid = codes >= 0
+        self.counts = np.bincount(codes[valid], minlength=len(self.groups))
+        # Row positions ordered by group; group i occupies order[offsets[i]:offsets[i + 1]]
+        self.order = np.flatnonzero(valid)[np.argsort(codes[valid], kind='stable')]
+        self.offsets = np.concatenate([[0], np.cumsum(self.counts)])
+
+    def __len__(self):
+        return len(self.groups)
+
+    @staticmethod
+    def _fingerprint(keys):
+        # Row order matters, so digest the row hashes in sequence rather than summing them
+        return hashlib.sha1(pd.util.hash_pandas_object(keys, index=True).to_numpy().tobytes()).hexdigest()
+
+    def matches(self, keys):
+        """
+        Check that `keys` is the same key column (values and index) the GroupIndex was built from.
+        """
+        keys = pd.Series(keys)
+        return len(keys) == self.n_rows and self._fingerprint(keys) == self.fingerprint
+
+    def _values(self, values):
+        if isinstance(values, pd.Series):
+            if not values.index.equals(self.source_index):
+                raise ValueError("Values are indexed differently from the keys the GroupIndex was built from. "
+                                 "Rebuild the GroupIndex on this snapshot of the data.")
+            values = values.to_numpy()
+        else:
+            values = np.asarray(values)
+        if len(values) != self.n_rows:
+            raise ValueError(f"Expected {self.n_rows} values to aggregate, got {len(values)}. "
+                             "Was the GroupIndex built on a different snapshot of the data?")
+        if values.dtype.kind not in 'biufMm':
+            values = values.astype(object)
+        return values
+
+    def _present(self, values):
+        # Rows that belong to a group and hold a non-missing value
+        present = self.codes >= 0
+        if values.dtype.kind in 'fOMm':
+            present &= pd.notna(values)
+        return present
+
+    def _numeric(self, values, how):
+        if values.dtype.kind not in 'biuf':
+            raise TypeError(f"'{how}' needs a numeric or bool column, got {values.dtype}.")
+        # Bool sums count the True values, as in pandas
+        return values.astype(np.int64) if values.dtype.kind == 'b' else values
+
+    def _reduce(self, values, ufunc):
+        if values.dtype.kind in 'fOMm':
+            # Skip missing values; groups with none left come out as NaN/NaT, as in pandas
+            present = self._present(values)
+            codes = self.codes[present]
+            order = np.argsort(codes, kind='stable')
+            sorted_values = values[present][order]
+            counts = np.bincount(codes, minlength=len(self.groups))
+            starts = np.concatenate([[0], np.cumsum(counts)[:-1]])[counts > 0]
+            reduced = ufunc.reduceat(sorted_values, starts) if len(starts) else sorted_values[:0]
+            missing = np.array('NaT', dtype=values.dtype) if values.dtype.kind in 'Mm' else np.nan
+            result = np.full(len(self.groups), missing, dtype=values.dtype)
+            result[counts > 0] = reduced
+            return result
+        # Without missing values every group is non-empty, so the offsets are valid reduceat boundaries
+        sorted_values, starts = values[self.order], self.offsets[:-1]
+        return ufunc.reduceat(sorted_values, starts) if len(starts) else sorted_values[:0]
+
+    def size(self):
+        return pd.Series(self.counts, index=self.groups)
+
+    def count(self, values):
+        values = self._values(values)
+        present = self._present(values)
+        return pd.Series(np.bincount(self.codes[present], minlength=len(self.groups)), index=self.groups)
+
+    def sum(self, values):
+        values = self._numeric(self._values(values), 'sum')
+        if values.dtype.kind == 'f':
+            present = self._present(values)
+            sums = np.bincount(self.codes[present], weights=values[present], minlength=len(self.groups))
+        else:
+            # Integer sums stay exact instead of going through float weights
+            sums = self._reduce(values, np.add)
+        return pd.Series(sums, index=self.groups)
+
+    def mean(self, values):
+        values = self._numeric(self._values(values), 'mean').astype(float)
+        present = self._present(values)
+        sums = np.bincount(self.codes[present], weights=values[present], minlength=len(self.groups))
+        counts = np.bincount(self.codes[present], minlength=len(self.groups))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return pd.Series(sums / counts, index=self.groups)
+
+    def min(self, values):
+        return pd.Series(self._reduce(self._values(values), np.minimum), index=self.groups)
+
+    def max(self, values):
+        return pd.Series(self._reduce(self._values(values), np.maximum), index=self.groups)
+
+    def aggregate(self, values, how):
+        if how not in self.AGGREGATIONS:
+            raise ValueError(f"Unsupported aggregation '{how}'. Choose from {self.AGGREGATIONS}.")
+        if how == 'size':
+            return self.size()
+        return getattr(self, how)(values)
+
+    def agg(self, df, aggregations):
+        """
+        Aggregate columns of `df` like `df.groupby(key).agg(aggregations)`.
+        `aggregations` maps a column to one aggregation name or a list of them;
+        lists produce MultiIndex columns, as in pandas.
+        """
+        result = {}
+        multi = any(isinstance(how, (list, tuple)) for how in aggregations.values())
+        for column, hows in aggregations.items():
+            for how in (hows if isinstance(hows, (list, tuple)) else [hows]):
+                result[(column, how) if multi else column] = self.aggregate(df[column], how)
+        return pd.DataFrame(result, index=self.groups)
+
+    def to_pickle(self, output_path):
+        """
+        Save the factorized index next to the data snapshot it was built from.
+        """
+        pd.to_pickle(self, output_path)
+        return output_path
+
+    @staticmethod
+    def read_pickle(index_path, keys=None):
+        """
+        Load a saved GroupIndex. Pass the current key column as `keys` to check it still matches the snapshot.
+        """
+        group_index = pd.read_pickle(index_path)
+        if keys is not None and not group_index.matches(keys):
+            raise ValueError(f"The cached GroupIndex at {index_path} was built from a different snapshot of the keys.")
+        return group_index
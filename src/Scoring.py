@@ -0,0 +1,285 @@
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from src.Cluster import load_centroids
+from src.GroupIndex import GroupIndex
+
+LOW_ENGAGEMENT_CLUSTER = 'Low Engagement'
+LOW_EXPERIENCE_CLUSTER = 'Low-Performance Users'
+SCORE_COLUMNS = ['Engagement Score', 'Experience Score', 'Satisfaction Score']
+
+
+def build_user_index(df, key_column, aggregations, group_index=None):
+    """
+    Aggregate the xDR sessions once per user so single users can be scored without the full dataset.
+    `aggregations` is a groupby `agg` mapping, e.g. {'Dur. (ms)': 'sum', 'Avg RTT DL (ms)': 'mean'}.
+    Pass a `group_index` already built on `key_column` to skip factorizing the keys again.
+    """
+    if group_index is None:
+        group_index = GroupIndex(df[key_column])
+    # GroupIndex keys come out sorted and unique, which keeps the per-request lookups on the fast path
+    return group_index.agg(df, aggregations)
+
+def save_user_index(user_index, output_path):
+    """
+    Save the per-user aggregate index to a pickle file.
+    """
+    user_index.to_pickle(output_path)
+    return output_path
+
+def load_user_index(index_path):
+    """
+    Load a per-user aggregate index saved with `save_user_index`.
+    """
+    return pd.read_pickle(index_path)
+
+
+class SatisfactionScorer:
+    """
+    Scores users from a precomputed aggregate index using the cluster centroids,
+    the fitted scalers and the satisfaction regression model.
+    """
+
+    def __init__(self, user_index, centroid_engagement, centroid_experience,
+                 engagement_columns, experience_columns, model, satisfaction_columns,
+                 engagement_scaler=None, experience_scaler=None, satisfaction_scaler=None):
+        self.user_index = user_index
+        self.engagement_columns = engagement_columns
+        self.experience_columns = experience_columns
+        self.satisfaction_columns = satisfaction_columns
+        self.model = model
+        self.engagement_scaler = engagement_scaler
+        self.experience_scaler = experience_scaler
+        self.satisfaction_scaler = satisfaction_scaler
+
+        # Pull the centroids and feature matrices out of pandas once, so scoring is plain numpy
+        self.engagement_centroid = centroid_engagement.loc[LOW_ENGAGEMENT_CLUSTER][engagement_columns].values.astype(float)
+        self.experience_centroid = centroid_experience.loc[LOW_EXPERIENCE_CLUSTER][experience_columns].values.astype(float)
+        self.engagement_values = user_index[engagement_columns].values.astype(float)
+        self.experience_values = user_index[experience_columns].values.astype(float)
+        missing_scores = [name for name in ('Engagement Score', 'Experience Score') if name not in satisfaction_columns]
+        if missing_scores:
+            raise ValueError(f"satisfaction_columns must include {missing_scores}.")
+        missing_columns = [column for column in satisfaction_columns
+                           if column not in ('Engagement Score', 'Experience Score') and column not in user_index.columns]
+        if missing_columns:
+            raise ValueError(f"The user index is missing the satisfaction feature columns {missing_columns}.")
+        self.satisfaction_values = user_index.reindex(columns=satisfaction_columns).values.astype(float)
+        self.score_positions = [satisfaction_columns.index(name) for name in ('Engagement Score', 'Experience Score')]
+
+    @classmethod
+    def from_files(cls, index_path, engagement_path, experience_path, model_path,
+                   engagement_columns, experience_columns, satisfaction_columns,
+                   engagement_scaler_path=None, experience_scaler_path=None, satisfaction_scaler_path=None):
+        """
+        Build a scorer from the saved user index, centroid CSVs and joblib-dumped model and scalers.
+        """
+        centroid_engagement, centroid_experience = load_centroids(engagement_path, experience_path)
+
+        def load_optional(path):
+            return joblib.load(path) if path else None
+
+        return cls(
+            load_user_index(index_path), centroid_engagement, centroid_experience,
+            engagement_columns, experience_columns, joblib.load(model_path), satisfaction_columns,
+            engagement_scaler=load_optional(engagement_scaler_path),
+            experience_scaler=load_optional(experience_scaler_path),
+            satisfaction_scaler=load_optional(satisfaction_scaler_path),
+        )
+
+    def _positions(self, keys):
+        # Query strings arrive as text, so coerce them to the index dtype before the lookup.
+        # Keys are coerced one by one, so a malformed key only misses its own slot in the batch.
+        keys = pd.Series(keys, dtype=object)
+        if pd.api.types.is_numeric_dtype(self.user_index.index.dtype):
+            keys = pd.to_numeric(keys, errors='coerce')
+        return self.user_index.index.get_indexer(keys)
+
+    def score(self, keys):
+        """
+        Score a batch of user keys (MSISDN/Number or IMSI, whichever the index is keyed by).
+        Unknown keys get NaN scores.
+        """
+        positions = self._positions(keys)
+        found = positions >= 0
+        scores = pd.DataFrame(np.nan, index=pd.Index(keys, name=self.user_index.index.name), columns=SCORE_COLUMNS)
+        if not found.any():
+            return scores
+
+        rows = positions[found]
+        engagement = self.engagement_values[rows]
+        experience = self.experience_values[rows]
+        if self.engagement_scaler is not None:
+            engagement = self.engagement_scaler.transform(engagement)
+        if self.experience_scaler is not None:
+            experience = self.experience_scaler.transform(experience)
+
+        # Euclidean distance to the "low" centroids, as in calculate_engagement_score / calculate_experience_score
+        engagement_score = np.linalg.norm(engagement - self.engagement_centroid, axis=1)
+        experience_score = np.linalg.norm(experience - self.experience_centroid, axis=1)
+
+        features = self.satisfaction_values[rows]
+        features[:, self.score_positions] = np.column_stack([engagement_score, experience_score])
+        features = pd.DataFrame(features, columns=self.satisfaction_columns)
+        if self.satisfaction_scaler is not None:
+            features = pd.DataFrame(self.satisfaction_scaler.transform(features), columns=self.satisfaction_columns)
+
+        scores.loc[found, 'Engagement Score'] = engagement_score
+        scores.loc[found, 'Experience Score'] = experience_score
+        scores.loc[found, 'Satisfaction Score'] = self.model.predict(features)
+        return scores
+
+
+class MicroBatcher:
+    """
+    Collects concurrent single-user requests and scores them together in one vectorized call.
+    """
+
+    def __init__(self, scorer, max_batch_size=256, max_wait_ms=2.0):
+        self.scorer = scorer
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.requests = queue.Queue()
+        self.thread = None
+        self.stopping = False
+        self.lock = threading.Lock()
+
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+        return self
+
+    def stop(self):
+        if self.thread is not None:
+            with self.lock:
+                self.stopping = True
+                self.requests.put(None)
+            self.thread.join()
+            self.thread = None
+            # Nothing will score what is still queued, so fail it instead of leaving callers blocked
+            self._fail_pending(RuntimeError("batcher stopped"))
+            self.stopping = False
+
+    def submit(self, key):
+        """
+        Queue one key for scoring and return a Future resolving to its score dict.
+        """
+        future = Future()
+        with self.lock:
+            if self.stopping:
+                future.set_exception(RuntimeError("batcher stopped"))
+            else:
+                self.requests.put((key, future))
+        return future
+
+    def score(self, key, timeout=None):
+        return self.submit(key).result(timeout=timeout)
+
+    def _fail_pending(self, error):
+        while True:
+            try:
+                item = self.requests.get_nowait()
+            except queue.Empty:
+                return
+            if item is not None and item[1].set_running_or_notify_cancel():
+                item[1].set_exception(error)
+
+    def _next_batch(self):
+        batch = []
+        first = self.requests.get()
+        if first is None:
+            return None
+        if first[1].set_running_or_notify_cancel():
+            batch.append(first)
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self.requests.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                # Finish the current batch, then let the loop see the stop signal
+                self.requests.put(None)
+                break
+            # Cancelled requests are dropped; the rest can no longer be cancelled once running
+            if item[1].set_running_or_notify_cancel():
+                batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            if not batch:
+                continue
+            keys = [key for key, _ in batch]
+            try:
+                scores = self.scorer.score(keys)
+                for (key, future), values in zip(batch, scores.to_numpy()):
+                    future.set_result(dict(zip(SCORE_COLUMNS, values.tolist())))
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+
+def _to_json(key, result):
+    # NaN is not valid JSON, unknown users are reported with null scores
+    payload = {'key': key}
+    payload.update({name: (None if np.isnan(value) else value) for name, value in result.items()})
+    return json.dumps(payload).encode('utf-8')
+
+class ScoringServer(ThreadingHTTPServer):
+    # The default backlog of 5 drops connections under concurrent load
+    request_queue_size = 1024
+    daemon_threads = True
+
+def make_scoring_server(batcher, host='127.0.0.1', port=8000, timeout=5.0):
+    """
+    Create a local HTTP server answering GET /score?key=<MSISDN or IMSI> from the micro-batcher.
+    Requests that fail or take longer than `timeout` seconds get a 500 with a JSON error body.
+    """
+    class ScoringHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            key = parse_qs(url.query).get('key', [None])[0]
+            if url.path != '/score':
+                self.send_json(404, json.dumps({'error': f"Unknown path {url.path}, expected /score"}).encode('utf-8'))
+                return
+            if key is None:
+                self.send_json(400, json.dumps({'error': "Expected GET /score?key=<MSISDN or IMSI>"}).encode('utf-8'))
+                return
+            try:
+                result = batcher.score(key, timeout=timeout)
+            except Exception as e:
+                self.send_json(500, json.dumps({'key': key, 'error': repr(e)}).encode('utf-8'))
+                return
+            status = 404 if np.isnan(result['Satisfaction Score']) else 200
+            self.send_json(status, _to_json(key, result))
+
+        def send_json(self, status, body):
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Per-request logging dominates latency under load
+            pass
+
+    return ScoringServer((host, port), ScoringHandler)
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from Dashboard import engagement_analysis_page as page
+from src.GroupIndex import GroupIndex
+
+
+@pytest.fixture
+def written(monkeypatch):
+    output = []
+    monkeypatch.setattr(page.st, 'write', lambda *args: output.append(args))
+    monkeypatch.setattr(page.st, 'warning', lambda *args: None)
+    return output
+
+@pytest.fixture
+def df_user_engagement(written):
+    raw = pd.DataFrame({
+        'MSISDN/Number': [33000000000.0, 33000000001.0, 33000000000.0, np.nan, 33000000002.0, 33000000001.0, 33000000000.0],
+        'Dur. (ms)': [1000.0, 2000.0, 3000.0, 4000.0, 5000.0, 6000.0, 7000.0],
+        'Total DL (Bytes)': [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0],
+        'Total UL (Bytes)': [7.0, 6.0, 5.0, 4.0, 3.0, 2.0, 1.0],
+    }) * [1, 1, 1024 ** 2, 1024 ** 2]
+    return page.preprocess_engagement_data(raw)
+
+
+@pytest.mark.parametrize('prebuilt', [True, False])
+def test_report_top_customers(df_user_engagement, written, prebuilt):
+    customer_index = GroupIndex(df_user_engagement['MSISDN/Number']) if prebuilt else None
+    grouped_df = page.report_top_customers(df_user_engagement, customer_index)
+
+    expected = df_user_engagement.groupby('MSISDN/Number').agg(**{
+        'Dur. (s)': ('Dur. (s)', 'sum'),
+        'Total DL (Megabytes)': ('Total DL (Megabytes)', 'sum'),
+        'Total UL (Megabytes)': ('Total UL (Megabytes)', 'sum'),
+        'Session Frequency': ('Dur. (s)', 'size'),
+    }).reset_index()
+    pd.testing.assert_frame_equal(grouped_df, expected)
+
+    # Four headed top-10 tables, the busiest customer first in each
+    tables = [args[0] for args in written if isinstance(args[0], pd.DataFrame)]
+    assert len(tables) == 4
+    assert tables[3]['MSISDN/Number'].iloc[0] == 33000000000.0
+    assert tables[3]['Session Frequency'].iloc[0] == 3
@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.GroupIndex import GroupIndex
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'Handset Type': ['b', 'a', None, 'c', 'a', 'b', 'c', 'a', None, 'd'],
+        'Throughput': [1.5, np.nan, 3.0, np.nan, 2.5, 4.0, np.nan, 0.5, 7.0, 1.0],
+        'Sessions': np.array([3, 1, 4, 1, 5, 9, 2, 6, 5, 3], dtype=np.int64),
+        'Roaming': [True, False, True, True, True, False, False, True, False, False],
+        'Manufacturer': ['x', 'z', 'y', None, 'y', 'w', None, 'x', 'q', 'v'],
+        'Start': pd.to_datetime(['2019-04-04', None, '2019-04-09', None, '2019-04-01',
+                                 '2019-04-25', None, '2019-04-12', '2019-04-02', '2019-04-30']),
+    })
+
+@pytest.fixture
+def group_index(df):
+    return GroupIndex(df['Handset Type'])
+
+
+@pytest.mark.parametrize('column', ['Throughput', 'Sessions', 'Roaming'])
+@pytest.mark.parametrize('how', ['sum', 'mean', 'count', 'min', 'max'])
+def test_numeric_aggregations_match_groupby(df, group_index, column, how):
+    expected = df.groupby('Handset Type')[column].agg(how)
+    pd.testing.assert_series_equal(group_index.aggregate(df[column], how), expected, check_names=False)
+
+@pytest.mark.parametrize('column', ['Manufacturer', 'Start'])
+@pytest.mark.parametrize('how', ['count', 'min', 'max'])
+def test_object_and_datetime_aggregations_match_groupby(df, group_index, column, how):
+    expected = df.groupby('Handset Type')[column].agg(how)
+    pd.testing.assert_series_equal(group_index.aggregate(df[column], how), expected, check_names=False)
+
+def test_datetime_without_missing_values(df, group_index):
+    start = df['Start'].fillna(pd.Timestamp('2019-04-15'))
+    expected = start.groupby(df['Handset Type']).min()
+    pd.testing.assert_series_equal(group_index.min(start), expected, check_names=False)
+
+def test_categorical_keys_are_observed_only(df):
+    keys = df['Handset Type'].astype(pd.CategoricalDtype(['a', 'b', 'c', 'd', 'unused']))
+    group_index = GroupIndex(keys)
+    expected = df['Throughput'].groupby(keys, observed=True).mean()
+    assert 'unused' not in group_index.mean(df['Throughput']).index
+    np.testing.assert_allclose(group_index.mean(df['Throughput']).to_numpy(), expected.to_numpy())
+
+def test_all_nan_group(df, group_index):
+    # Handset 'c' only has missing throughput values
+    assert np.isnan(group_index.min(df['Throughput'])['c'])
+    assert np.isnan(group_index.mean(df['Throughput'])['c'])
+    assert group_index.sum(df['Throughput'])['c'] == 0
+    assert group_index.count(df['Throughput'])['c'] == 0
+
+def test_size_skips_nan_keys(df, group_index):
+    pd.testing.assert_series_equal(group_index.size(), df.groupby('Handset Type').size())
+
+def test_integer_sums_are_exact():
+    values = np.array([2 ** 53, 1, 1], dtype=np.int64)
+    group_index = GroupIndex(pd.Series(['a', 'a', 'a']))
+    assert group_index.sum(values)['a'] == 2 ** 53 + 2
+
+def test_agg_matches_groupby_agg(df, group_index):
+    aggregations = {
+        'Throughput': ['min', 'max', 'mean', 'sum', 'count'],
+        'Sessions': ['min', 'max', 'mean', 'sum'],
+        'Manufacturer': ['min', 'max'],
+        'Start': ['min', 'max', 'count'],
+    }
+    pd.testing.assert_frame_equal(group_index.agg(df, aggregations), df.groupby('Handset Type').agg(aggregations))
+
+    flat = {'Throughput': 'mean', 'Sessions': 'sum'}
+    pd.testing.assert_frame_equal(group_index.agg(df, flat), df.groupby('Handset Type').agg(flat))
+
+def test_empty_input():
+    df = pd.DataFrame({'Handset Type': pd.Series([], dtype=object), 'Throughput': pd.Series([], dtype=float)})
+    group_index = GroupIndex(df['Handset Type'])
+    assert len(group_index) == 0
+    result = group_index.agg(df, {'Throughput': ['sum', 'mean', 'min', 'max', 'count']})
+    assert result.empty
+
+@pytest.mark.parametrize('column', ['Manufacturer', 'Start'])
+def test_sum_rejects_non_numeric(df, group_index, column):
+    with pytest.raises(TypeError, match='numeric'):
+        group_index.sum(df[column])
+
+def test_rejects_values_from_another_snapshot(df, group_index):
+    with pytest.raises(ValueError, match='indexed differently'):
+        group_index.mean(df['Throughput'].sample(frac=1, random_state=0))
+    with pytest.raises(ValueError, match='Expected 10 values'):
+        group_index.mean(df['Throughput'].to_numpy()[:5])
+
+def test_pickle_round_trip(df, group_index, tmp_path):
+    path = group_index.to_pickle(tmp_path / 'handset_index.pkl')
+    loaded = GroupIndex.read_pickle(path, keys=df['Handset Type'])
+    pd.testing.assert_frame_equal(loaded.agg(df, {'Throughput': 'mean'}), group_index.agg(df, {'Throughput': 'mean'}))
+
+    refilled = df['Handset Type'].fillna('a')
+    with pytest.raises(ValueError, match='different snapshot'):
+        GroupIndex.read_pickle(path, keys=refilled)
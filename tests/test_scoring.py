@@ -0,0 +1,211 @@
+import json
+import threading
+import time
+from concurrent.futures import Future
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from src.Cluster import calculate_engagement_score, calculate_experience_score
+from src.Scoring import SatisfactionScorer, MicroBatcher, build_user_index, make_scoring_server
+
+ENGAGEMENT_COLUMNS = ['Dur. (ms)', 'Total Traffic (Bytes)']
+EXPERIENCE_COLUMNS = ['Avg RTT DL (ms)']
+SATISFACTION_COLUMNS = ['Engagement Score', 'Experience Score', 'Total Traffic (Bytes)']
+AGGREGATIONS = {'Dur. (ms)': 'sum', 'Total Traffic (Bytes)': 'sum', 'Avg RTT DL (ms)': 'mean'}
+
+
+@pytest.fixture
+def sessions():
+    return pd.DataFrame({
+        'MSISDN/Number': [33000000000.0, 33000000001.0, 33000000000.0, np.nan, 33000000002.0, 33000000001.0],
+        'Dur. (ms)': [1000.0, 2000.0, 3000.0, 4000.0, 5000.0, 6000.0],
+        'Total Traffic (Bytes)': [10.0, 20.0, 30.0, 40.0, 50.0, 60.0],
+        'Avg RTT DL (ms)': [10.0, 20.0, 30.0, 40.0, 50.0, 60.0],
+    })
+
+@pytest.fixture
+def user_index(sessions):
+    return build_user_index(sessions, 'MSISDN/Number', AGGREGATIONS)
+
+@pytest.fixture
+def centroids():
+    centroid_engagement = pd.DataFrame(
+        {'Dur. (ms)': [1000.0, 9000.0], 'Total Traffic (Bytes)': [10.0, 90.0]},
+        index=pd.Index(['Low Engagement', 'High Engagement'], name='Cluster Name'))
+    centroid_experience = pd.DataFrame(
+        {'Avg RTT DL (ms)': [80.0, 10.0]},
+        index=pd.Index(['Low-Performance Users', 'High-Performance Users'], name='Cluster Name'))
+    return centroid_engagement, centroid_experience
+
+@pytest.fixture
+def scorer(user_index, centroids):
+    features = pd.DataFrame({
+        'Engagement Score': [1.0, 2.0, 3.0, 4.0],
+        'Experience Score': [2.0, 1.0, 4.0, 3.0],
+        'Total Traffic (Bytes)': [5.0, 7.0, 1.0, 2.0],
+    })
+    model = LinearRegression().fit(features, [1.0, 2.0, 3.0, 5.0])
+    return SatisfactionScorer(user_index, *centroids, ENGAGEMENT_COLUMNS, EXPERIENCE_COLUMNS, model, SATISFACTION_COLUMNS)
+
+
+def test_build_user_index(sessions, user_index):
+    expected = sessions.groupby('MSISDN/Number').agg(AGGREGATIONS)
+    pd.testing.assert_frame_equal(user_index, expected)
+    assert user_index.index.is_monotonic_increasing
+
+def test_scores_match_notebook_math(scorer, user_index, centroids):
+    expected = calculate_engagement_score(user_index.copy(), centroids[0], ENGAGEMENT_COLUMNS)
+    expected = calculate_experience_score(expected, centroids[1], EXPERIENCE_COLUMNS)
+    scores = scorer.score(list(user_index.index))
+
+    np.testing.assert_allclose(scores['Engagement Score'], expected['Engagement Score'])
+    np.testing.assert_allclose(scores['Experience Score'], expected['Experience Score'])
+    np.testing.assert_allclose(scores['Satisfaction Score'], scorer.model.predict(expected[SATISFACTION_COLUMNS]))
+
+def test_unknown_keys_score_nan(scorer):
+    scores = scorer.score([12345.0, 33000000000.0])
+    assert scores.loc[12345.0].isna().all()
+    assert scores.loc[33000000000.0].notna().all()
+
+def test_malformed_key_does_not_poison_batch(scorer):
+    scores = scorer.score(['33000000000.0', 'abc', 33000000001.0])
+    assert scores.iloc[0].notna().all()
+    assert scores.iloc[1].isna().all()
+    assert scores.iloc[2].notna().all()
+
+def test_missing_satisfaction_column_raises(user_index, centroids):
+    with pytest.raises(ValueError, match='Total Traffic'):
+        SatisfactionScorer(user_index.drop(columns='Total Traffic (Bytes)'), *centroids,
+                           ['Dur. (ms)'], EXPERIENCE_COLUMNS, LinearRegression(), SATISFACTION_COLUMNS)
+
+def test_micro_batcher_resolves_concurrent_futures(scorer):
+    batcher = MicroBatcher(scorer, max_batch_size=8, max_wait_ms=20).start()
+    try:
+        keys = [33000000000.0, 33000000001.0, 33000000002.0, 'abc']
+        futures = [batcher.submit(key) for key in keys]
+        results = [future.result(timeout=5) for future in futures]
+    finally:
+        batcher.stop()
+
+    expected = scorer.score(keys)
+    for result, (_, row) in zip(results, expected.iterrows()):
+        np.testing.assert_allclose(list(result.values()), row.to_numpy())
+
+def test_micro_batcher_propagates_exceptions():
+    class FailingScorer:
+        def score(self, keys):
+            raise RuntimeError("scoring failed")
+
+    batcher = MicroBatcher(FailingScorer()).start()
+    try:
+        futures = [batcher.submit(key) for key in range(3)]
+        for future in futures:
+            with pytest.raises(RuntimeError, match="scoring failed"):
+                future.result(timeout=5)
+    finally:
+        batcher.stop()
+
+def test_micro_batcher_survives_cancelled_future(scorer):
+    # Queue before starting, so the cancel deterministically lands before the worker picks it up
+    batcher = MicroBatcher(scorer, max_wait_ms=20)
+    futures = [batcher.submit(key) for key in [33000000000.0, 33000000001.0, 33000000002.0]]
+    assert futures[1].cancel()
+    batcher.start()
+    try:
+        assert futures[0].result(timeout=5)['Satisfaction Score'] is not None
+        assert futures[2].result(timeout=5)['Satisfaction Score'] is not None
+        assert not np.isnan(batcher.score(33000000001.0, timeout=5)['Satisfaction Score'])
+    finally:
+        batcher.stop()
+
+def test_micro_batcher_stop_fails_pending_requests():
+    release = threading.Event()
+
+    class BlockingScorer:
+        def score(self, keys):
+            release.wait(5)
+            return pd.DataFrame(1.0, index=keys, columns=['Engagement Score', 'Experience Score', 'Satisfaction Score'])
+
+    batcher = MicroBatcher(BlockingScorer(), max_wait_ms=0).start()
+    in_flight = batcher.submit(1)
+    stopper = threading.Thread(target=batcher.stop)
+    stopper.start()
+    while not batcher.stopping:
+        time.sleep(0.001)
+    late = batcher.submit(2)
+    release.set()
+    stopper.join(5)
+
+    assert in_flight.result(timeout=5)['Satisfaction Score'] == 1.0
+    with pytest.raises(RuntimeError, match="batcher stopped"):
+        late.result(timeout=5)
+
+def test_micro_batcher_stop_drains_queue(scorer):
+    batcher = MicroBatcher(scorer).start()
+    # The worker exits on the first sentinel, stranding the request queued behind it
+    batcher.requests.put(None)
+    stranded = Future()
+    batcher.requests.put((33000000000.0, stranded))
+    batcher.stop()
+    with pytest.raises(RuntimeError, match="batcher stopped"):
+        stranded.result(timeout=5)
+
+@pytest.fixture
+def serve():
+    started = []
+
+    def start(batcher):
+        server = make_scoring_server(batcher, port=0, timeout=1.0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        started.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in started:
+        server.shutdown()
+        server.server_close()
+
+def get_json(url):
+    try:
+        with urlopen(url) as response:
+            return response.status, json.loads(response.read())
+    except HTTPError as e:
+        return e.code, json.loads(e.read())
+
+def test_server_scores_and_reports_unknown_keys(scorer, serve):
+    batcher = MicroBatcher(scorer).start()
+    try:
+        base_url = serve(batcher)
+        status, body = get_json(f"{base_url}/score?key=33000000000")
+        assert status == 200
+        assert body['Satisfaction Score'] is not None
+
+        status, body = get_json(f"{base_url}/score?key=abc")
+        assert status == 404
+        assert body['Satisfaction Score'] is None
+    finally:
+        batcher.stop()
+
+def test_server_reports_scoring_errors(serve):
+    class FailingBatcher:
+        def score(self, key, timeout=None):
+            raise RuntimeError("scoring failed")
+
+    status, body = get_json(f"{serve(FailingBatcher())}/score?key=1")
+    assert status == 500
+    assert 'scoring failed' in body['error']
+
+def test_server_bad_requests_get_json_errors(scorer, serve):
+    base_url = serve(MicroBatcher(scorer))
+    status, body = get_json(f"{base_url}/other?key=1")
+    assert status == 404
+    assert 'error' in body
+
+    status, body = get_json(f"{base_url}/score")
+    assert status == 400
+    assert 'error' in body